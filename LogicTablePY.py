@@ -1,5 +1,16 @@
-import itertools
+import functools
 import re
+import sys
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = None
 
 # ----------- AST Nodes -----------
 
@@ -10,12 +21,29 @@ This program takes a logical statement as input and generates its truth table.
 '''
 
 class Expr:
-    def evaluate(self, context):
+    def evaluate(self, context, memo=None):
+        """Evaluate in a single environment -- a sequence of 0/1 ints
+        indexed by Var.idx (see index_variables). Returns 0 or 1;
+        everything is bitwise, so no value is ever branched on. memo
+        caches results per node so shared (hash-consed) subterms are
+        computed at most once."""
+        raise NotImplementedError()
+
+    def eval_column(self, var_cols):
+        """Evaluate this expression over all rows at once. var_cols is
+        a sequence of length-2^N bool ndarrays indexed by Var.idx."""
         raise NotImplementedError()
-    
+
+    def eval_mask(self, var_masks, full_mask):
+        """Evaluate this expression over all rows packed into one int.
+        Bit r of the result is the truth value in row r; var_masks is a
+        sequence of 2^N-bit masks indexed by Var.idx and full_mask is
+        all ones."""
+        raise NotImplementedError()
+
     def vars(self):
         raise NotImplementedError()
-    
+
     def __str__(self):
         raise NotImplementedError()
 
@@ -23,13 +51,27 @@ class Expr:
 class Var(Expr):
     def __init__(self, name):
         self.name = name
-    
-    def evaluate(self, context):
-        return context[self.name]
-    
+        self.idx = None  # assigned by index_variables
+        self._hash = hash((Var, name))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return self is other or (type(other) is Var and self.name == other.name)
+
+    def evaluate(self, context, memo=None):
+        return context[self.idx]
+
+    def eval_column(self, var_cols):
+        return var_cols[self.idx]
+
+    def eval_mask(self, var_masks, full_mask):
+        return var_masks[self.idx]
+
     def vars(self):
         return {self.name}
-    
+
     def __str__(self):
         return self.name
 
@@ -37,13 +79,35 @@ class Var(Expr):
 class Not(Expr):
     def __init__(self, operand):
         self.operand = operand
-    
-    def evaluate(self, context):
-        return not self.operand.evaluate(context)
-    
+        self._vars = None
+        self._hash = hash((Not, operand))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return self is other or (type(other) is Not and self.operand == other.operand)
+
+    def evaluate(self, context, memo=None):
+        if memo is None:
+            memo = {}
+        if self in memo:
+            return memo[self]
+        v = 1 ^ self.operand.evaluate(context, memo)
+        memo[self] = v
+        return v
+
+    def eval_column(self, var_cols):
+        return ~self.operand.eval_column(var_cols)
+
+    def eval_mask(self, var_masks, full_mask):
+        return full_mask ^ self.operand.eval_mask(var_masks, full_mask)
+
     def vars(self):
-        return self.operand.vars()
-    
+        if self._vars is None:
+            self._vars = self.operand.vars()
+        return self._vars
+
     def __str__(self):
         return f"~{self.operand}"
 
@@ -52,57 +116,149 @@ class BinOp(Expr):
     def __init__(self, left, right):
         self.left = left
         self.right = right
-    
+        self._vars = None
+        self._hash = hash((type(self), left, right))
+
+    def __hash__(self):
+        return self._hash
+
+    def __eq__(self, other):
+        return self is other or (type(other) is type(self)
+                                 and self.left == other.left
+                                 and self.right == other.right)
+
     def vars(self):
-        return self.left.vars().union(self.right.vars())
+        if self._vars is None:
+            self._vars = self.left.vars().union(self.right.vars())
+        return self._vars
 
 
 class And(BinOp):
-    def evaluate(self, context):
-        return self.left.evaluate(context) and self.right.evaluate(context)
-    
+    def evaluate(self, context, memo=None):
+        if memo is None:
+            memo = {}
+        if self in memo:
+            return memo[self]
+        v = self.left.evaluate(context, memo) & self.right.evaluate(context, memo)
+        memo[self] = v
+        return v
+
+    def eval_column(self, var_cols):
+        return self.left.eval_column(var_cols) & self.right.eval_column(var_cols)
+
+    def eval_mask(self, var_masks, full_mask):
+        return self.left.eval_mask(var_masks, full_mask) & self.right.eval_mask(var_masks, full_mask)
+
     def __str__(self):
         return f"({self.left} & {self.right})"
 
 
 class Or(BinOp):
-    def evaluate(self, context):
-        return self.left.evaluate(context) or self.right.evaluate(context)
-    
+    def evaluate(self, context, memo=None):
+        if memo is None:
+            memo = {}
+        if self in memo:
+            return memo[self]
+        v = self.left.evaluate(context, memo) | self.right.evaluate(context, memo)
+        memo[self] = v
+        return v
+
+    def eval_column(self, var_cols):
+        return self.left.eval_column(var_cols) | self.right.eval_column(var_cols)
+
+    def eval_mask(self, var_masks, full_mask):
+        return self.left.eval_mask(var_masks, full_mask) | self.right.eval_mask(var_masks, full_mask)
+
     def __str__(self):
         return f"({self.left} | {self.right})"
 
 
 class Implies(BinOp):
-    def evaluate(self, context):
-        return not self.left.evaluate(context) or self.right.evaluate(context)
-    
+    def evaluate(self, context, memo=None):
+        if memo is None:
+            memo = {}
+        if self in memo:
+            return memo[self]
+        v = (1 ^ self.left.evaluate(context, memo)) | self.right.evaluate(context, memo)
+        memo[self] = v
+        return v
+
+    def eval_column(self, var_cols):
+        return ~self.left.eval_column(var_cols) | self.right.eval_column(var_cols)
+
+    def eval_mask(self, var_masks, full_mask):
+        return (full_mask ^ self.left.eval_mask(var_masks, full_mask)) | self.right.eval_mask(var_masks, full_mask)
+
     def __str__(self):
         return f"({self.left} -> {self.right})"
 
 
 class Iff(BinOp):
-    def evaluate(self, context):
-        return self.left.evaluate(context) == self.right.evaluate(context)
-    
+    def evaluate(self, context, memo=None):
+        if memo is None:
+            memo = {}
+        if self in memo:
+            return memo[self]
+        v = 1 ^ (self.left.evaluate(context, memo) ^ self.right.evaluate(context, memo))
+        memo[self] = v
+        return v
+
+    def eval_column(self, var_cols):
+        return ~(self.left.eval_column(var_cols) ^ self.right.eval_column(var_cols))
+
+    def eval_mask(self, var_masks, full_mask):
+        return full_mask ^ (self.left.eval_mask(var_masks, full_mask) ^ self.right.eval_mask(var_masks, full_mask))
+
     def __str__(self):
         return f"({self.left} <-> {self.right})"
 
 
 # ----------- Tokenizer -----------
 
-TOKEN_REGEX = r'\s*(~|&|\||->|<->|\(|\)|[A-Za-z][A-Za-z0-9_]*)\s*'
+_TOKEN = re.compile(r'\s*(~|&|\||->|<->|\(|\)|[A-Za-z][A-Za-z0-9_]*)\s*')
+
+# Canonical operator strings: mapping matches through this dict makes
+# every operator token the same object, so == in the parser hits the
+# identity fast path.
+_OPS = {op: op for op in ("~", "&", "|", "->", "<->", "(", ")")}
 
 def tokenize(s):
-    return re.findall(TOKEN_REGEX, s)
+    ops = _OPS
+    return [ops.get(t, t) for t in _TOKEN.findall(s)]
 
 
 # ----------- Parser -----------
 
+# Binding strength of each binary operator, loosest first
+PREC = {"<->": 1, "->": 2, "|": 3, "&": 4}
+CTOR = {"<->": Iff, "->": Implies, "|": Or, "&": And}
+
+
+@functools.lru_cache(maxsize=128)
+def parse_cached(tokens):
+    """
+    Parse a token tuple into a reordered AST, caching the result so
+    re-submitting a formula (the run-again loop) skips parse and
+    analysis entirely. Returns (ast, variables in first-seen order).
+    """
+    parser = Parser(list(tokens))
+    ast = parser.parse()
+    reorder_shortcircuit(ast)
+    return ast, tuple(parser.seen_vars)
+
+
 class Parser:
     def __init__(self, tokens):
         self.tokens = tokens
         self.pos = 0
+        self.intern = {}
+        self.seen_vars = []  # variable names in order of first appearance
+        self._seen = set()
+
+    def _intern(self, node):
+        # Hash-consing: structurally equal subtrees share one node, so
+        # repeated subterms like (A & B) | (A & B) form a DAG, not a tree.
+        return self.intern.setdefault(node, node)
 
     def peek(self):
         return self.tokens[self.pos] if self.pos < len(self.tokens) else None
@@ -113,64 +269,53 @@ class Parser:
         return tok
 
     def parse(self):
-        return self.parse_iff()
-
-    def parse_iff(self):
-        left = self.parse_implies()
-        while self.peek() == "<->":
-            self.consume()
-            right = self.parse_implies()
-            left = Iff(left, right)
-        return left
-
-    def parse_implies(self):
-        left = self.parse_or()
-        while self.peek() == "->":
-            self.consume()
-            right = self.parse_or()
-            left = Implies(left, right)
-        return left
-
-    def parse_or(self):
-        left = self.parse_and()
-        while self.peek() == "|":
-            self.consume()
-            right = self.parse_and()
-            left = Or(left, right)
-        return left
-
-    def parse_and(self):
-        left = self.parse_not()
-        while self.peek() == "&":
-            self.consume()
-            right = self.parse_not()
-            left = And(left, right)
+        return self.parse_expr(1)
+
+    def parse_expr(self, min_prec):
+        # Precedence climbing: one loop handles every binary operator
+        # level instead of one recursive method per level.
+        left = self.parse_unary()
+        tokens = self.tokens
+        n = len(tokens)
+        prec_table = PREC
+        while self.pos < n:
+            tok = tokens[self.pos]
+            prec = prec_table.get(tok)
+            if prec is None or prec < min_prec:
+                break
+            self.pos += 1
+            right = self.parse_expr(prec + 1)
+            left = self._intern(CTOR[tok](left, right))
         return left
 
-    def parse_not(self):
-        if self.peek() == "~":
-            self.consume()
-            operand = self.parse_not()
-            return Not(operand)
-        else:
-            return self.parse_atom()
-
-    def parse_atom(self):
+    def parse_unary(self):
         tok = self.peek()
-        if tok == "(":
+        if tok == "~":
+            self.consume()
+            operand = self.parse_unary()
+            return self._intern(Not(operand))
+        elif tok == "(":
             self.consume()
-            expr = self.parse()
+            expr = self.parse_expr(1)
             if self.peek() != ")":
                 raise ValueError("Expected closing parenthesis")
             self.consume()
             return expr
         else:
             self.consume()
-            return Var(tok)
+            node = self._intern(Var(tok))
+            if tok not in self._seen:
+                self._seen.add(tok)
+                self.seen_vars.append(tok)
+            return node
 
 
 # ----------- Premise Sperator -------------------
 
+# Everything split_premises reacts to; the regex engine scans between
+# matches so the per-character Python loop goes away
+_SPLIT = re.compile(r'(\()|(\))|(therefore)|(\|-)|(,)')
+
 def split_premises(statement):
     """
     Split a statement into premises and conclusion if 'therefore' is present. Using Commas and |- as well.
@@ -180,32 +325,22 @@ def split_premises(statement):
     parts = [] # Collected parts
     depth = 0 # Parenthesis depth
     start = 0 # Start index of current part
-    i = 0
 
-    while i < len(statement):
-        char = statement[i] # Current character
+    for m in _SPLIT.finditer(statement):
+        group = m.lastindex
 
-        if char == '(':
+        if group == 1:
             depth += 1
-        elif char == ')':
+        elif group == 2:
             depth -= 1
-
-        # Check for 'therefore' or '|-'
-        
-        if depth == 0:
-            if statement.startswith('therefore', i):
-                parts.append(statement[start:i].strip())
-                conclusion = statement[i + len('therefore'):].strip()
+        elif depth == 0:
+            if group == 5: # comma
+                parts.append(statement[start:m.start()].strip())
+                start = m.end()
+            else: # 'therefore' or '|-'
+                parts.append(statement[start:m.start()].strip())
+                conclusion = statement[m.end():].strip()
                 return parts, conclusion
-            elif statement.startswith('|-', i):
-                parts.append(statement[start:i].strip())
-                conclusion = statement[i + len('|-'):].strip()
-                return parts, conclusion
-            elif char == ',':
-                parts.append(statement[start:i].strip())
-                start = i + 1
-
-        i += 1
 
     tail = statement[start:].strip() # Remaining part after last split
     if tail:
@@ -216,30 +351,260 @@ def split_premises(statement):
 
 # ----------- Sub-expression collector -----------
 
-def collect_subexpressions(expr, collected=None):
+def collect_subexpressions(expr, collected=None, seen=None):
     """
     Collect all unique non-variable sub-expressions in order from leaves to root.
     """
     if collected is None:
         collected = []
+        seen = set()
 
-    # Skip if already collected
-    if any(expr is node for node in collected):
+    # Skip if already collected; interning makes identity equal to
+    # structural equality, and id() skips the recursive __eq__/__hash__
+    if id(expr) in seen:
         return collected
+    seen.add(id(expr))
 
     # Recurse first
     if isinstance(expr, Not):
-        collect_subexpressions(expr.operand, collected)
+        collect_subexpressions(expr.operand, collected, seen)
         collected.append(expr)
     elif isinstance(expr, BinOp):
-        collect_subexpressions(expr.left, collected)
-        collect_subexpressions(expr.right, collected)
+        collect_subexpressions(expr.left, collected, seen)
+        collect_subexpressions(expr.right, collected, seen)
         collected.append(expr)
 
     return collected
 
+# ----------- Short-circuit analysis -----------
+
+def estimate_p_true(expr):
+    """
+    Estimate how often the expression is true, assuming independent
+    variables that are true half the time.
+    """
+    if isinstance(expr, Var):
+        return 0.5
+    if isinstance(expr, Not):
+        return 1.0 - estimate_p_true(expr.operand)
+    pl = estimate_p_true(expr.left)
+    pr = estimate_p_true(expr.right)
+    if isinstance(expr, And):
+        return pl * pr
+    if isinstance(expr, Or):
+        return 1.0 - (1.0 - pl) * (1.0 - pr)
+    if isinstance(expr, Implies):
+        return 1.0 - pl * (1.0 - pr)
+    return pl * pr + (1.0 - pl) * (1.0 - pr)  # Iff
+
+
+def reorder_shortcircuit(expr):
+    """
+    Swap And/Or operands so the side most likely to short-circuit the
+    other (often-false for And, often-true for Or) is evaluated first,
+    preferring cheap Var leaves on ties. And/Or are commutative, so the
+    table is unchanged apart from operand order in the headers.
+    """
+    if isinstance(expr, Var):
+        return
+    if isinstance(expr, Not):
+        reorder_shortcircuit(expr.operand)
+        return
+    reorder_shortcircuit(expr.left)
+    reorder_shortcircuit(expr.right)
+    if isinstance(expr, (And, Or)):
+        pl = estimate_p_true(expr.left)
+        pr = estimate_p_true(expr.right)
+        if isinstance(expr, And):
+            swap = pr < pl
+        else:
+            swap = pr > pl
+        if pl == pr:
+            swap = isinstance(expr.right, Var) and not isinstance(expr.left, Var)
+        if swap:
+            expr.left, expr.right = expr.right, expr.left
+        # Children changed places; keep the structural hash consistent
+        expr._hash = hash((type(expr), expr.left, expr.right))
+
+
+# ----------- Bytecode compiler -----------
+
+# Opcodes for the flat stack evaluator
+VAR, NOT, AND, OR, IMP, IFF = range(6)
+
+_OPCODE = {Not: NOT, And: AND, Or: OR, Implies: IMP, Iff: IFF}
+
+
+def compile_to_bytecode(expr, var_index):
+    """
+    Linearize an expression post-order into parallel (ops, args) lists
+    for eval_bytecode. args holds the variable index for VAR opcodes
+    and 0 otherwise.
+    """
+    ops = []
+    args = []
+
+    def walk(node):
+        if isinstance(node, Var):
+            ops.append(VAR)
+            args.append(var_index[node.name])
+            return
+        if isinstance(node, Not):
+            walk(node.operand)
+        else:
+            walk(node.left)
+            walk(node.right)
+        ops.append(_OPCODE[type(node)])
+        args.append(0)
+
+    walk(expr)
+    return ops, args
+
+
+def eval_bytecode(ops, args, var_values, full_mask=1):
+    """
+    Run a compiled program with a small value stack -- one tight loop,
+    no attribute lookups or method dispatch per node. var_values is a
+    sequence indexed by variable index; values may be 0/1 ints or packed
+    2^N-bit row masks (full_mask supplies NOT's all-ones value).
+    """
+    stack = []
+    push = stack.append
+    for op, a in zip(ops, args):
+        if op == VAR:
+            push(var_values[a])
+        elif op == NOT:
+            stack[-1] = full_mask ^ stack[-1]
+        elif op == AND:
+            b = stack.pop()
+            stack[-1] = stack[-1] & b
+        elif op == OR:
+            b = stack.pop()
+            stack[-1] = stack[-1] | b
+        elif op == IMP:
+            b = stack.pop()
+            stack[-1] = (full_mask ^ stack[-1]) | b
+        else:  # IFF
+            b = stack.pop()
+            stack[-1] = full_mask ^ (stack[-1] ^ b)
+    return stack[-1]
+
+
+if njit is not None and np is not None:
+    @njit(parallel=True, cache=True)
+    def _eval_all_rows(ops, args, starts, n_vars, n_rows, max_depth, out):
+        # Runs every program segment on every row; bit n_vars-1-a of the
+        # row index is variable a's value, matching build_var_masks.
+        # Values stay np.bool_ throughout -- no int flags in conditionals.
+        for r in prange(n_rows):
+            stack = np.empty(max_depth, np.bool_)
+            for k in range(starts.size - 1):
+                sp = 0
+                for j in range(starts[k], starts[k + 1]):
+                    op = ops[j]
+                    if op == 0:  # VAR
+                        stack[sp] = ((r >> (n_vars - 1 - args[j])) & 1) != 0
+                        sp += 1
+                    elif op == 1:  # NOT
+                        stack[sp - 1] = not stack[sp - 1]
+                    elif op == 2:  # AND
+                        sp -= 1
+                        stack[sp - 1] = stack[sp - 1] & stack[sp]
+                    elif op == 3:  # OR
+                        sp -= 1
+                        stack[sp - 1] = stack[sp - 1] | stack[sp]
+                    elif op == 4:  # IMP
+                        sp -= 1
+                        stack[sp - 1] = (not stack[sp - 1]) | stack[sp]
+                    else:  # IFF
+                        sp -= 1
+                        stack[sp - 1] = not (stack[sp - 1] ^ stack[sp])
+                out[r, k] = stack[0]
+
+
+def eval_columns_numba(exprs, var_index, n_rows):
+    """
+    Evaluate every premise over all rows with the JIT kernel.
+    Returns one bool column per premise, or None when Numba is absent.
+    """
+    if njit is None or np is None:
+        return None
+
+    ops_all = []
+    args_all = []
+    starts = [0]
+    for e in exprs:
+        ops, args = compile_to_bytecode(e, var_index)
+        ops_all.extend(ops)
+        args_all.extend(args)
+        starts.append(len(ops_all))
+
+    max_depth = max(s1 - s0 for s0, s1 in zip(starts, starts[1:]))
+    out = np.empty((n_rows, len(exprs)), np.bool_)
+    _eval_all_rows(
+        np.asarray(ops_all, np.uint8),
+        np.asarray(args_all, np.int32),
+        np.asarray(starts, np.int64),
+        len(var_index), n_rows, max_depth, out,
+    )
+    return [out[:, k] for k in range(len(exprs))]
+
+
+# ----------- Runtime codegen -----------
+
+def compile_numpy_program(exprs):
+    """
+    Partially evaluate the premises into straight-line Python source --
+    one bitwise statement per unique sub-expression (C0, C1, ...) over
+    the variable columns V[idx], with each premise's result aliased to
+    R0, R1, ... -- and compile it once. exec'ing the code object against
+    {"V": var_cols} then evaluates the whole table with no AST dispatch.
+    """
+    collected = []
+    seen = set()
+    for e in exprs:
+        collect_subexpressions(e, collected, seen)
+
+    names = {node: f"C{i}" for i, node in enumerate(collected)}
+
+    def ref(node):
+        return f"V[{node.idx}]" if isinstance(node, Var) else names[node]
+
+    lines = []
+    for node, name in names.items():
+        if isinstance(node, Not):
+            rhs = f"~{ref(node.operand)}"
+        elif isinstance(node, And):
+            rhs = f"{ref(node.left)} & {ref(node.right)}"
+        elif isinstance(node, Or):
+            rhs = f"{ref(node.left)} | {ref(node.right)}"
+        elif isinstance(node, Implies):
+            rhs = f"~{ref(node.left)} | {ref(node.right)}"
+        else:  # Iff
+            rhs = f"~({ref(node.left)} ^ {ref(node.right)})"
+        lines.append(f"{name} = {rhs}")
+    for k, e in enumerate(exprs):
+        lines.append(f"R{k} = {ref(e)}")
+
+    return compile("\n".join(lines), "<formula>", "exec")
+
+
 # ----------- Helpers -----------
 
+def index_variables(expr, var_index):
+    """
+    Assign Var.idx from the name->index map so evaluation contexts can
+    be plain sequences instead of per-row dicts.
+    """
+    if isinstance(expr, Var):
+        expr.idx = var_index[expr.name]
+    elif isinstance(expr, Not):
+        index_variables(expr.operand, var_index)
+    else:
+        index_variables(expr.left, var_index)
+        index_variables(expr.right, var_index)
+
+
 def and_all(exprs):
     result = exprs[0]
     for e in exprs[1:]:
@@ -249,9 +614,31 @@ def and_all(exprs):
 
 # ----------- Truth table generator -----------
 
-def truth_table_multiple(exprs):
-    # Collect all variables across all premises
-    variables = sorted(set().union(*(e.vars() for e in exprs)))
+@functools.lru_cache(maxsize=32)
+def build_var_masks(N):
+    """
+    Build one 2^N-bit mask per variable, indexed by variable index,
+    where bit r is the variable's value in row r. Matches the column
+    ordering: the first variable changes slowest, so var i alternates
+    in blocks of 2^(N-1-i) bits. Cached per N since the masks depend
+    only on the variable count.
+    """
+    masks = []
+    for i in range(N):
+        block = 1 << (N - 1 - i)  # run length of equal bits
+        ones_block = ((1 << block) - 1) << block
+        period = block << 1
+        # Closed form: repeat ones_block every period bits across all
+        # 2^N rows with one multiply instead of a per-block loop
+        masks.append(ones_block * (((1 << (1 << N)) - 1) // ((1 << period) - 1)))
+    return masks
+
+
+def truth_table_multiple(exprs, variables=None):
+    # Callers that parsed the premises pass the variables in first-seen
+    # order; otherwise fall back to one memoized vars() pass per premise
+    if variables is None:
+        variables = sorted(set().union(*(e.vars() for e in exprs)))
 
     headers = variables + [str(e) for e in exprs] + ["ALL TRUE"]
     col_width = max(len(h) for h in headers) + 2
@@ -260,31 +647,83 @@ def truth_table_multiple(exprs):
     print(header_line)
     print("-" * len(header_line))
 
-    for values in itertools.product([False, True], repeat=len(variables)):
-        env = dict(zip(variables, values))
-        row = []
-
-        # Variable columns
-        for v in variables:
-            row.append("T" if env[v] else "F")
-
-        # Premise columns
-        premise_vals = []
-        for e in exprs:
-            val = e.evaluate(env)
-            premise_vals.append(val)
-            row.append("T" if val else "F")
-
-        # All-premises-true column
-        row.append("T" if all(premise_vals) else "F")
-
-        print(" | ".join(r.center(col_width) for r in row))
+    N = len(variables)
+    n_rows = 2 ** N
+
+    # Index-based contexts: no per-row name->value dicts anywhere below
+    var_index = {v: i for i, v in enumerate(variables)}
+    for e in exprs:
+        index_variables(e, var_index)
+
+    # AND the premises most-likely-false first so the ALL TRUE column
+    # empties (and the accumulation stops) as early as possible
+    and_order = sorted(range(len(exprs)), key=lambda k: estimate_p_true(exprs[k]))
+
+    if np is None or n_rows <= 64:
+        # SWAR path: each truth column is one 2^N-bit int, so a single
+        # bitwise op evaluates every row at once (64+ rows per CPU op).
+        full_mask = (1 << n_rows) - 1
+        var_masks = build_var_masks(N)
+
+        # Run each premise as flat bytecode over the packed masks
+        premise_masks = [
+            eval_bytecode(*compile_to_bytecode(e, var_index), var_masks, full_mask)
+            for e in exprs
+        ]
+
+        all_true_mask = full_mask
+        for k in and_order:
+            all_true_mask &= premise_masks[k]
+            if not all_true_mask:
+                break
+
+        masks = var_masks + premise_masks + [all_true_mask]
+
+        # Emit the whole body in one write: T/F cells are centered once,
+        # not once per cell, and stdout is hit once, not 2^N times.
+        cells = ("F".center(col_width), "T".center(col_width))
+        body = "\n".join(
+            " | ".join(cells[(m >> r) & 1] for m in masks)
+            for r in range(n_rows)
+        )
+        sys.stdout.write(body + "\n")
+        return
+
+    # One bool column of length 2^N per variable: bit N-1-i of the row
+    # index is variable i's value, so the first variable changes slowest.
+    idx = np.arange(n_rows, dtype=np.int64)
+    var_cols = [((idx >> (N - 1 - i)) & 1).astype(bool) for i in range(N)]
+
+    # Evaluate every premise as a whole column in one pass, through the
+    # JIT kernel when Numba is installed
+    premise_cols = eval_columns_numba(exprs, var_index, n_rows)
+    if premise_cols is None:
+        # Run the premises as compiled straight-line bitwise statements
+        # instead of walking the AST per column
+        env = {"V": var_cols}
+        exec(compile_numpy_program(exprs), env)
+        premise_cols = [env[f"R{k}"] for k in range(len(exprs))]
+
+    all_true_col = np.ones(n_rows, dtype=bool)
+    for k in and_order:
+        all_true_col &= premise_cols[k]
+        if not all_true_col.any():
+            break
+
+    columns = var_cols + premise_cols + [all_true_col]
+
+    # Same single-write batching as the mask path, via a 2-entry lookup
+    # of pre-centered cells indexed by the bool matrix
+    lookup = np.array(["F".center(col_width), "T".center(col_width)])
+    cells = lookup[np.column_stack(columns).astype(np.int8)]
+    body = "\n".join(" | ".join(row) for row in cells)
+    sys.stdout.write(body + "\n")
 
 
 
 # ----------- Main -----------
 
-if __name__ == "__main__":
+def main():
     print("Logic Statement Truth Table Generator")
     print("Operators: ~ (NOT), & (AND), | (OR), -> (IMPLIES), <-> (IFF)")
 
@@ -295,20 +734,29 @@ if __name__ == "__main__":
     # Multiple premises, no conclusion
     if isinstance(split, list):
         premises = []
+        variables = []
+        seen = set()
         for p in split:
-            tokens = tokenize(p)
-            premises.append(Parser(tokens).parse())
+            ast, ast_vars = parse_cached(tuple(tokenize(p)))
+            premises.append(ast)
+            for v in ast_vars:
+                if v not in seen:
+                    seen.add(v)
+                    variables.append(v)
 
         expr = and_all(premises)
-        truth_table_multiple(premises)
+        truth_table_multiple(premises, variables)
 
 
-    print( "Press R to run again or any other key to exit. ")
+if __name__ == "__main__":
+    # Re-running in-process keeps the warm interpreter (and any Numba
+    # compilation) instead of spawning a fresh one via os.system
+    while True:
+        main()
 
-    if input().lower() == 'r':
-        import os
-        os.system('python ' + __file__)
-    else:
-        print("Exiting...")
-        exit()
+        print( "Press R to run again or any other key to exit. ")
+
+        if input().lower() != 'r':
+            print("Exiting...")
+            break
 